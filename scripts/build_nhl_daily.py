@@ -3,27 +3,41 @@ from __future__ import annotations
 
 import datetime as dt
 import hashlib
+import io
 import json
 import os
 import re
 import math
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from html.parser import HTMLParser
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
-from urllib.parse import urlencode
-from urllib.request import Request, urlopen
-
 import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter, Retry
 
 # Keep the import, but do not rely on it. We will fallback to scraping if it KeyErrors.
 from scripts.fetch_starters_dailyfaceoff import fetch_dailyfaceoff_starters
 from scripts.compute_rest import build_slim_rest
+from scripts.team_map import TEAM_TO_ABBR, TEAM_NAME_ALIASES
 
 try:
     from zoneinfo import ZoneInfo
 except Exception:
     ZoneInfo = None  # type: ignore
 
+try:
+    import orjson
+except Exception:
+    orjson = None  # type: ignore
+
+try:
+    from lxml import html as lxml_html
+except Exception:
+    lxml_html = None  # type: ignore
+
 SCHEMA_VERSION = "1.0.14"
 SPORT_KEY = "icehockey_nhl"
 
@@ -34,46 +48,32 @@ MP_GOALIES_URL = "https://moneypuck.com/moneypuck/playerData/seasonSummary/2025/
 
 # --------------------------- TEAM NAME -> ABBREV -------------------------------
 
+# Compiled here because normalize_team_key is needed at import time to build
+# the lookup table below.
+_NON_ALNUM_RE = re.compile(r"[^A-Z0-9\s]")
+_WS_RE = re.compile(r"\s+")
+
+
+def normalize_team_key(v: Any) -> str:
+    """
+    Normalize team strings across sources to improve map hit rate.
+    Example: "Utah Mammoth" -> "UTAH MAMMOTH"
+    """
+    s = str(v or "").strip().upper()
+    s = _NON_ALNUM_RE.sub(" ", s)
+    s = _WS_RE.sub(" ", s).strip()
+    return s
+
+
+# Derived from scripts.team_map (canonical names plus aliases, including the
+# Arizona -> Utah relocation), with keys pre-normalized the same way lookups
+# are. Keeping one source table means the builder and the starters fetcher
+# can no longer drift apart on spellings.
 TEAM_NAME_TO_ABBREV: Dict[str, str] = {
-    "ANAHEIM DUCKS": "ANA",
-    "ARIZONA COYOTES": "UTA",  # Arizona -> Utah (32-team world)
-    "BOSTON BRUINS": "BOS",
-    "BUFFALO SABRES": "BUF",
-    "CALGARY FLAMES": "CGY",
-    "CAROLINA HURRICANES": "CAR",
-    "CHICAGO BLACKHAWKS": "CHI",
-    "COLORADO AVALANCHE": "COL",
-    "COLUMBUS BLUE JACKETS": "CBJ",
-    "DALLAS STARS": "DAL",
-    "DETROIT RED WINGS": "DET",
-    "EDMONTON OILERS": "EDM",
-    "FLORIDA PANTHERS": "FLA",
-    "LOS ANGELES KINGS": "LAK",
-    "MINNESOTA WILD": "MIN",
-    "MONTREAL CANADIENS": "MTL",
-    "NASHVILLE PREDATORS": "NSH",
-    "NEW JERSEY DEVILS": "NJD",
-    "NEW YORK ISLANDERS": "NYI",
-    "NEW YORK RANGERS": "NYR",
-    "OTTAWA SENATORS": "OTT",
-    "PHILADELPHIA FLYERS": "PHI",
-    "PITTSBURGH PENGUINS": "PIT",
-    "SAN JOSE SHARKS": "SJS",
-    "SEATTLE KRAKEN": "SEA",
-    "ST. LOUIS BLUES": "STL",
-    "ST LOUIS BLUES": "STL",
-    "TAMPA BAY LIGHTNING": "TBL",
-    "TORONTO MAPLE LEAFS": "TOR",
-    "VANCOUVER CANUCKS": "VAN",
-    "VEGAS GOLDEN KNIGHTS": "VGK",
-    "WASHINGTON CAPITALS": "WSH",
-    "WINNIPEG JETS": "WPG",
-    # Utah aliases (must hit from any source)
-    "UTAH": "UTA",
-    "UTAH HOCKEY CLUB": "UTA",
-    "UTAH HC": "UTA",
-    "UTAH MAMMOTH": "UTA",
+    normalize_team_key(name): abbr for name, abbr in TEAM_TO_ABBR.items()
 }
+for _alias, _canonical in TEAM_NAME_ALIASES.items():
+    TEAM_NAME_TO_ABBREV[normalize_team_key(_alias)] = TEAM_TO_ABBR[_canonical]
 
 ABBREV_SET = set(TEAM_NAME_TO_ABBREV.values())
 ALL_TEAM_ABBREVS_SORTED = sorted(ABBREV_SET)
@@ -95,6 +95,10 @@ def _parse_iso_utc(s: Any) -> Optional[dt.datetime]:
     """
     if not isinstance(s, str) or not s.strip():
         return None
+    # Cheap shape check so non-timestamp strings bail without paying for a
+    # raised-and-caught ValueError from fromisoformat.
+    if len(s) < 10 or s[4] != "-" or s[7] != "-":
+        return None
     try:
         t = dt.datetime.fromisoformat(s.replace("Z", "+00:00"))
         if t.tzinfo is None:
@@ -134,29 +138,210 @@ def et_date_from_commence_iso(commence_time_utc: Any) -> Optional[str]:
 
 # --------------------------- network helpers ---------------------------------
 
-def http_get_bytes(url: str, headers: Optional[Dict[str, str]] = None, timeout: int = 30) -> bytes:
-    req = Request(url, headers=headers or {})
-    with urlopen(req, timeout=timeout) as resp:
-        return resp.read()
+# One pooled session for every GET: the two MoneyPuck CSVs share one TLS
+# connection, and retries on transient upstream errors come for free.
+SESSION = requests.Session()
+SESSION.headers.update({"User-Agent": "nhl-daily-slim", "Accept-Encoding": "gzip, deflate"})
+_ADAPTER = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=4,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504)),
+)
+SESSION.mount("https://", _ADAPTER)
+SESSION.mount("http://", _ADAPTER)
+
+
+def http_get_bytes(
+    url: str,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: int = 30,
+    params: Optional[Dict[str, str]] = None,
+) -> bytes:
+    resp = SESSION.get(url, headers=headers or {}, params=params, timeout=timeout)
+    resp.raise_for_status()
+    return resp.content
+
+
+def json_loads_bytes(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
+def json_dumps_bytes(obj: Any, pretty: bool = True) -> bytes:
+    if orjson is not None:
+        opts = orjson.OPT_SORT_KEYS
+        if pretty:
+            opts |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=opts)
+    s = json.dumps(obj, ensure_ascii=False, indent=2 if pretty else None, sort_keys=True, allow_nan=False)
+    return s.encode("utf-8")
+
+
+def http_get_json(
+    url: str,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: int = 30,
+    params: Optional[Dict[str, str]] = None,
+) -> Tuple[Any, bytes]:
+    raw = http_get_bytes(url, headers=headers, timeout=timeout, params=params)
+    return json_loads_bytes(raw), raw
+
+
+_HTTP_CACHE_DIR = Path("data/.cache")
+
+
+def cached_get_bytes(
+    url: str,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: int = 30,
+    cache_dir: Path = _HTTP_CACHE_DIR,
+) -> Tuple[bytes, str]:
+    """
+    Conditional GET with an on-disk ETag cache. Returns (body, blake2b hex).
 
+    Stores the body, ETag, and body hash under cache_dir keyed by sha1(url);
+    sends If-None-Match on subsequent runs and reuses the cached bytes on
+    HTTP 304 (without rehashing — the hash is read back from the meta file).
+    The hash of a fresh body is computed while the response streams in, so
+    the bytes are only traversed once.
+    """
+    key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    meta_path = cache_dir / f"{key}.meta.json"
+    body_path = cache_dir / f"{key}.body"
+
+    etag: Optional[str] = None
+    cached_digest: Optional[str] = None
+    if meta_path.exists() and body_path.exists():
+        try:
+            meta = json_loads_bytes(meta_path.read_bytes())
+            etag = meta.get("etag")
+            cached_digest = meta.get("blake2b")
+        except Exception:
+            etag = None
+
+    req_headers = dict(headers or {})
+    if etag:
+        req_headers["If-None-Match"] = etag
+
+    resp = SESSION.get(url, headers=req_headers, timeout=timeout, stream=True)
+    if resp.status_code == 304 and body_path.exists():
+        raw = body_path.read_bytes()
+        return raw, cached_digest or hashlib.blake2b(raw, digest_size=32).hexdigest()
+    resp.raise_for_status()
+
+    h = hashlib.blake2b(digest_size=32)
+    parts: List[bytes] = []
+    for chunk in resp.iter_content(65536):
+        if chunk:
+            h.update(chunk)
+            parts.append(chunk)
+    raw = b"".join(parts)
+    digest = h.hexdigest()
+    new_etag = resp.headers.get("ETag")
+
+    if new_etag:
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            body_path.write_bytes(raw)
+            meta_path.write_bytes(
+                json_dumps_bytes({"etag": new_etag, "blake2b": digest, "url": url}, pretty=False)
+            )
+        except Exception:
+            pass
+
+    return raw, digest
+
+
+# Fixed alias tables for column resolution, one tuple per logical field.
+# pick_col walks these in order; the usecols frozensets below are derived
+# from them so the read_csv pushdown can never drift out of sync with the
+# resolver.
+TEAM_COL_CANDIDATES = (
+    "team", "Team", "teamName", "teamname", "name", "abbrev", "Abbrev",
+    "teamAbbrev", "team_abbrev", "TeamAbbrev",
+)
+SITUATION_COL_CANDIDATES = ("situation", "Situation")
+POSITION_COL_CANDIDATES = ("position", "Position")
+GP_COL_CANDIDATES = ("gamesPlayed", "GP", "gp", "games", "Games", "games_played")
+XGF_TOTAL_COL_CANDIDATES = ("xGoalsFor", "xGF", "xGoalsForAll", "xGoalsForTotal", "xGoalsForAllStrengths")
+XGA_TOTAL_COL_CANDIDATES = ("xGoalsAgainst", "xGA", "xGoalsAgainstAll", "xGoalsAgainstTotal", "xGoalsAgainstAllStrengths")
+XGF_PG_COL_CANDIDATES = ("xGF_pg", "xGFPerGame", "xGoalsForPerGame", "xGoalsFor_pg")
+XGA_PG_COL_CANDIDATES = ("xGA_pg", "xGAPerGame", "xGoalsAgainstPerGame", "xGoalsAgainst_pg")
+GF_TOTAL_COL_CANDIDATES = ("goalsFor", "GF", "goals_for", "GoalsFor")
+GA_TOTAL_COL_CANDIDATES = ("goalsAgainst", "GA", "goals_against", "GoalsAgainst")
+
+GOALIE_NAME_COL_CANDIDATES = ("goalie", "Goalie", "playerName", "name")
+GSAE60_COL_CANDIDATES = ("goalsSavedAboveExpectedPer60", "GSAx/60", "gsaxPer60", "gsax_per60", "GSAx_per60")
+GSAE_COL_CANDIDATES = ("goalsSavedAboveExpected", "GSAx", "gsae", "gsax")
+
+# Lowercased names of every column the teams/goalies transforms can consume.
+# Passed to read_csv as a usecols predicate so the parser skips the ~100
+# unused stat columns in the MoneyPuck CSVs entirely.
+TEAMS_CSV_USECOLS = frozenset(
+    c.lower()
+    for c in (
+        TEAM_COL_CANDIDATES
+        + SITUATION_COL_CANDIDATES
+        + POSITION_COL_CANDIDATES
+        + GP_COL_CANDIDATES
+        + XGF_TOTAL_COL_CANDIDATES
+        + XGA_TOTAL_COL_CANDIDATES
+        + XGF_PG_COL_CANDIDATES
+        + XGA_PG_COL_CANDIDATES
+        + GF_TOTAL_COL_CANDIDATES
+        + GA_TOTAL_COL_CANDIDATES
+    )
+)
 
-def http_get_json(url: str, headers: Optional[Dict[str, str]] = None, timeout: int = 30) -> Tuple[Any, bytes]:
-    raw = http_get_bytes(url, headers=headers, timeout=timeout)
-    return json.loads(raw.decode("utf-8")), raw
+GOALIES_CSV_USECOLS = frozenset(
+    c.lower() for c in (GOALIE_NAME_COL_CANDIDATES + GSAE60_COL_CANDIDATES + GSAE_COL_CANDIDATES)
+)
 
 
-def read_csv_url(url: str, timeout: int = 30) -> pd.DataFrame:
-    raw = http_get_bytes(url, headers={"User-Agent": "nhl-daily-slim"}, timeout=timeout)
-    return pd.read_csv(pd.io.common.BytesIO(raw))
+def read_csv_subset(raw: bytes, wanted_lower: frozenset) -> pd.DataFrame:
+    return pd.read_csv(io.BytesIO(raw), engine="c", usecols=lambda c: str(c).strip().lower() in wanted_lower)
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> bool:
+    """
+    Write to a sibling tmp file and os.replace into place (crash-safe).
+
+    Keeps a <name>.blake2b digest of the last written payload under the
+    cache directory and returns False without touching the file when the
+    content is unchanged, so no-op runs leave the artifact's mtime alone
+    (and git sees no diff). The digest lives in data/.cache so the happy
+    path never drops untracked files next to the committed artifacts.
+    """
+    digest = hashlib.blake2b(data, digest_size=32).hexdigest()
+    sidecar = _HTTP_CACHE_DIR / f"{path.name}.blake2b"
+    try:
+        if path.exists() and sidecar.read_text().strip() == digest:
+            return False
+    except Exception:
+        pass
+
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with tmp.open("wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+    try:
+        _HTTP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        sidecar.write_text(digest + "\n")
+    except Exception:
+        pass
+    return True
 
 
 def norm_cols(df: pd.DataFrame) -> pd.DataFrame:
-    out = df.copy()
+    # Shallow copy: only the column labels change, so there is no need to
+    # duplicate the underlying data blocks.
+    out = df.copy(deep=False)
     out.columns = [str(c).strip() for c in out.columns]
     return out
 
 
-def pick_col(df: pd.DataFrame, candidates: List[str]) -> Optional[str]:
+def pick_col(df: pd.DataFrame, candidates: Tuple[str, ...]) -> Optional[str]:
     cols = set(df.columns)
     for c in candidates:
         if c in cols:
@@ -170,33 +355,29 @@ def pick_col(df: pd.DataFrame, candidates: List[str]) -> Optional[str]:
 
 # --------------------------- normalization helpers ----------------------------
 
-def normalize_team_key(v: Any) -> str:
-    """
-    Normalize team strings across sources to improve map hit rate.
-    Example: "Utah Mammoth" -> "UTAH MAMMOTH"
-    """
-    s = str(v or "").strip().upper()
-    s = re.sub(r"[^A-Z0-9\s]", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
-
+# Compiled once: these run per token/name across every scrape and transform.
+_ISO_TOKEN_RE = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}")
+_NAME_TOKEN_RE = re.compile(r"^[A-Za-z .'\-]+$")
 
-def normalize_team_abbrev(v: Any) -> Optional[str]:
-    if v is None:
-        return None
 
-    s = normalize_team_key(v)
+@lru_cache(maxsize=256)
+def _abbrev_from_label(s: str) -> Optional[str]:
+    s = normalize_team_key(s)
 
     # direct abbrev
     if s in ABBREV_SET:
         return s
 
     # name map
-    mapped = TEAM_NAME_TO_ABBREV.get(s)
-    if mapped:
-        return mapped
+    return TEAM_NAME_TO_ABBREV.get(s) or None
 
-    return None
+
+def normalize_team_abbrev(v: Any) -> Optional[str]:
+    if v is None:
+        return None
+    # The label vocabulary is ~32 teams plus aliases and this runs per row,
+    # per game, and per scraped token — memoize on the raw string.
+    return _abbrev_from_label(str(v))
 
 
 def normalize_status(v: Any) -> str:
@@ -212,7 +393,7 @@ def normalize_goalie_name(v: Any) -> Optional[str]:
     if v is None:
         return None
     name = str(v).strip()
-    name = re.sub(r"\s+", " ", name)
+    name = _WS_RE.sub(" ", name)
     return name or None
 
 
@@ -232,12 +413,10 @@ def median_int(values: List[int]) -> Optional[float]:
 def pick_most_common_float(values: List[float]) -> Optional[float]:
     if not values:
         return None
-    counts: Dict[float, int] = {}
-    for v in values:
-        counts[v] = counts.get(v, 0) + 1
+    counts = Counter(values)
     best_count = max(counts.values())
-    tied = [k for k, c in counts.items() if c == best_count]
-    return min(tied)
+    # Deterministic tie-break: lowest value among the most common.
+    return min(k for k, c in counts.items() if c == best_count)
 
 
 # --------------------------- id helpers --------------------------------------
@@ -252,69 +431,59 @@ def game_id_from_names(commence_time_utc: str, away_team_name: str, home_team_na
 
 
 def goalie_id_from_name(name: str) -> str:
-    base = re.sub(r"\s+", " ", (name or "").strip().lower())
+    base = _WS_RE.sub(" ", (name or "").strip().lower())
     h = hashlib.sha1(base.encode("utf-8")).hexdigest()[:8]
     return f"g_{h}"
 
 
 # --------------------------- odds helpers ------------------------------------
 
-def extract_market(bookmaker: Dict[str, Any], market_key: str) -> Optional[Dict[str, Any]]:
-    markets = bookmaker.get("markets") or []
-    for m in markets:
-        if m.get("key") == market_key:
-            return m
-    return None
-
-
-def slim_odds_current(odds_payload: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
-    slimmed: List[Dict[str, Any]] = []
-    meta: Dict[str, Any] = {"games_with_h2h": 0, "games_with_totals": 0}
+def _slim_game(g: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    commence = g.get("commence_time")
+    home_team = g.get("home_team")
+    away_team = g.get("away_team")
+    if not (commence and home_team and away_team):
+        return None
 
-    for g in odds_payload or []:
-        commence = g.get("commence_time")
-        home_team = g.get("home_team")
-        away_team = g.get("away_team")
-        if not (commence and home_team and away_team):
-            continue
+    gid = game_id_from_names(commence, away_team, home_team)
+    if not gid:
+        return None
 
-        gid = game_id_from_names(commence, away_team, home_team)
-        if not gid:
-            continue
+    bookmakers = g.get("bookmakers") or []
 
-        bookmakers = g.get("bookmakers") or []
+    # h2h state indexed by side (0=home, 1=away); the dispatch table keeps
+    # one compare/update path instead of mirrored home/away branches.
+    side_of_name = {home_team: 0, away_team: 1}
+    h2h_prices: Tuple[List[int], List[int]] = ([], [])
+    h2h_best: List[Optional[Tuple[int, str]]] = [None, None]
 
-        best_home: Optional[Tuple[int, str]] = None
-        best_away: Optional[Tuple[int, str]] = None
-        home_prices: List[int] = []
-        away_prices: List[int] = []
+    total_points: List[float] = []
+    best_over_by_point: Dict[float, Tuple[int, str]] = {}
+    best_under_by_point: Dict[float, Tuple[int, str]] = {}
 
-        total_points: List[float] = []
-        best_over_by_point: Dict[float, Tuple[int, str]] = {}
-        best_under_by_point: Dict[float, Tuple[int, str]] = {}
+    for bm in bookmakers:
+        bm_key = bm.get("key") or ""
 
-        for bm in bookmakers:
-            bm_key = bm.get("key") or ""
+        # Single pass over markets; dispatch on key instead of scanning
+        # the list once for "h2h" and again for "totals".
+        for m in bm.get("markets") or ():
+            mk = m.get("key")
 
-            m_h2h = extract_market(bm, "h2h")
-            if m_h2h:
-                outcomes = m_h2h.get("outcomes") or []
-                for o in outcomes:
-                    name = o.get("name")
+            if mk == "h2h":
+                for o in m.get("outcomes") or ():
+                    side = side_of_name.get(o.get("name"))
+                    if side is None:
+                        continue
                     price = o.get("price")
-                    if name == home_team and isinstance(price, int):
-                        home_prices.append(price)
-                        if best_home is None or price > best_home[0]:
-                            best_home = (price, bm_key)
-                    elif name == away_team and isinstance(price, int):
-                        away_prices.append(price)
-                        if best_away is None or price > best_away[0]:
-                            best_away = (price, bm_key)
-
-            m_totals = extract_market(bm, "totals")
-            if m_totals:
-                outcomes = m_totals.get("outcomes") or []
-                for o in outcomes:
+                    if not isinstance(price, int):
+                        continue
+                    h2h_prices[side].append(price)
+                    cur = h2h_best[side]
+                    if cur is None or price > cur[0]:
+                        h2h_best[side] = (price, bm_key)
+
+            elif mk == "totals":
+                for o in m.get("outcomes") or ():
                     name = o.get("name")
                     price = o.get("price")
                     point = o.get("point")
@@ -338,54 +507,58 @@ def slim_odds_current(odds_payload: List[Dict[str, Any]]) -> Tuple[List[Dict[str
                         if cur is None or price > cur[0]:
                             best_under_by_point[pt] = (price, bm_key)
 
-        consensus_home = median_int(home_prices)
-        consensus_away = median_int(away_prices)
+    best_home, best_away = h2h_best
+    consensus_home = median_int(h2h_prices[0])
+    consensus_away = median_int(h2h_prices[1])
 
-        has_h2h = best_home is not None and best_away is not None
-        if has_h2h:
-            meta["games_with_h2h"] += 1
+    has_h2h = best_home is not None and best_away is not None
 
-        consensus_total_line = pick_most_common_float(total_points)
-        has_totals = consensus_total_line is not None
-        if has_totals:
-            meta["games_with_totals"] += 1
+    consensus_total_line = pick_most_common_float(total_points)
+    has_totals = consensus_total_line is not None
 
-        out_game: Dict[str, Any] = {
-            "id": gid,
-            "commence_time": commence,
-            "home_team": home_team,
-            "away_team": away_team,
+    out_game: Dict[str, Any] = {
+        "id": gid,
+        "commence_time": commence,
+        "home_team": home_team,
+        "away_team": away_team,
+    }
+
+    if has_h2h:
+        out_game["h2h"] = {
+            "best": {
+                "home_price": best_home[0],
+                "away_price": best_away[0],
+                "home_book": best_home[1],
+                "away_book": best_away[1],
+            },
+            "consensus_median": {
+                "home_price": consensus_home,
+                "away_price": consensus_away,
+            },
         }
 
-        if has_h2h:
-            out_game["h2h"] = {
-                "best": {
-                    "home_price": best_home[0],
-                    "away_price": best_away[0],
-                    "home_book": best_home[1],
-                    "away_book": best_away[1],
-                },
-                "consensus_median": {
-                    "home_price": consensus_home,
-                    "away_price": consensus_away,
-                },
-            }
+    if has_totals:
+        best_over = best_over_by_point.get(consensus_total_line)
+        best_under = best_under_by_point.get(consensus_total_line)
+        out_game["totals"] = {
+            "line": consensus_total_line,
+            "best": {
+                "over_price": best_over[0] if best_over else None,
+                "under_price": best_under[0] if best_under else None,
+                "over_book": best_over[1] if best_over else None,
+                "under_book": best_under[1] if best_under else None,
+            },
+        }
 
-        if has_totals:
-            best_over = best_over_by_point.get(consensus_total_line)
-            best_under = best_under_by_point.get(consensus_total_line)
-            out_game["totals"] = {
-                "line": consensus_total_line,
-                "best": {
-                    "over_price": best_over[0] if best_over else None,
-                    "under_price": best_under[0] if best_under else None,
-                    "over_book": best_over[1] if best_over else None,
-                    "under_book": best_under[1] if best_under else None,
-                },
-            }
+    return out_game
 
-        slimmed.append(out_game)
 
+def slim_odds_current(odds_payload: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    slimmed = [e for e in (_slim_game(g) for g in odds_payload or []) if e is not None]
+    meta = {
+        "games_with_h2h": sum(1 for e in slimmed if "h2h" in e),
+        "games_with_totals": sum(1 for e in slimmed if "totals" in e),
+    }
     return slimmed, meta
 
 
@@ -400,19 +573,18 @@ def fetch_odds_current() -> Tuple[Optional[List[Dict[str, Any]]], Dict[str, Any]
     markets = os.environ.get("ODDS_API_MARKETS", "h2h,totals").strip()
 
     base_url = "https://api.the-odds-api.com/v4/sports/icehockey_nhl/odds"
-    qs = urlencode(
-        {
-            "apiKey": api_key,
-            "regions": regions,
-            "markets": markets,
-            "oddsFormat": "american",
-            "dateFormat": "iso",
-        }
-    )
-    url = f"{base_url}?{qs}"
+    # One base params dict; a historical snapshot call would reuse it as
+    # {**base_params, "date": snapshot_iso_z}.
+    base_params = {
+        "apiKey": api_key,
+        "regions": regions,
+        "markets": markets,
+        "oddsFormat": "american",
+        "dateFormat": "iso",
+    }
 
     try:
-        payload, _raw = http_get_json(url)
+        payload, _raw = http_get_json(base_url, params=base_params)
         return payload, {"ok": True}
     except Exception as e:
         return None, {"ok": False, "error": str(e)}
@@ -447,7 +619,17 @@ def is_per60_col(col_name: str) -> bool:
     return ("per60" in s) or ("/60" in s) or ("_60" in s) or ("per 60" in s)
 
 
-def pick_col_prefer_non_per60(df: pd.DataFrame, candidates: List[str]) -> Optional[str]:
+def lower_in_mask(series: pd.Series, targets: set) -> pd.Series:
+    """
+    Case-insensitive membership mask. Lowercases once per unique value via a
+    categorical instead of allocating a lowercased copy of every row.
+    """
+    cat = series.astype("category")
+    keep = {i for i, c in enumerate(cat.cat.categories) if str(c).strip().lower() in targets}
+    return cat.cat.codes.isin(keep)
+
+
+def pick_col_prefer_non_per60(df: pd.DataFrame, candidates: Tuple[str, ...]) -> Optional[str]:
     cols = list(df.columns)
     lower_map = {c.lower(): c for c in cols}
 
@@ -464,33 +646,50 @@ def pick_col_prefer_non_per60(df: pd.DataFrame, candidates: List[str]) -> Option
 def build_slim_teams_and_lambda(teams_df: pd.DataFrame) -> Tuple[List[Dict[str, Any]], float]:
     df = norm_cols(teams_df)
 
-    team_col = pick_col(
-        df,
-        ["team", "Team", "teamName", "teamname", "name", "abbrev", "Abbrev", "teamAbbrev", "team_abbrev", "TeamAbbrev"],
-    )
-    gp_col = pick_col(df, ["gamesPlayed", "GP", "gp", "games", "Games", "games_played"])
+    # Drop non-"all" situation rows (and non-team rows) up front with a
+    # vectorized mask, instead of relying on first-row-wins during the
+    # per-row loop below.
+    sit_col = pick_col(df, SITUATION_COL_CANDIDATES)
+    if sit_col:
+        df = df[lower_in_mask(df[sit_col], {"all"})]
+
+    pos_col = pick_col(df, POSITION_COL_CANDIDATES)
+    if pos_col:
+        df = df[lower_in_mask(df[pos_col], {"team", "team level"})]
+
+    team_col = pick_col(df, TEAM_COL_CANDIDATES)
+    gp_col = pick_col(df, GP_COL_CANDIDATES)
 
     # Prefer totals, avoid per60 columns
-    xgf_total_col = pick_col_prefer_non_per60(
-        df, ["xGoalsFor", "xGF", "xGoalsForAll", "xGoalsForTotal", "xGoalsForAllStrengths"]
-    )
-    xga_total_col = pick_col_prefer_non_per60(
-        df, ["xGoalsAgainst", "xGA", "xGoalsAgainstAll", "xGoalsAgainstTotal", "xGoalsAgainstAllStrengths"]
-    )
+    xgf_total_col = pick_col_prefer_non_per60(df, XGF_TOTAL_COL_CANDIDATES)
+    xga_total_col = pick_col_prefer_non_per60(df, XGA_TOTAL_COL_CANDIDATES)
 
     # If totals not available, fall back to per-game cols (still avoid per60)
-    xgf_pg_col = pick_col_prefer_non_per60(df, ["xGF_pg", "xGFPerGame", "xGoalsForPerGame", "xGoalsFor_pg"])
-    xga_pg_col = pick_col_prefer_non_per60(df, ["xGA_pg", "xGAPerGame", "xGoalsAgainstPerGame", "xGoalsAgainst_pg"])
+    xgf_pg_col = pick_col_prefer_non_per60(df, XGF_PG_COL_CANDIDATES)
+    xga_pg_col = pick_col_prefer_non_per60(df, XGA_PG_COL_CANDIDATES)
 
     # Last fallback: GF/GA totals
-    gf_total_col = pick_col_prefer_non_per60(df, ["goalsFor", "GF", "goals_for", "GoalsFor"])
-    ga_total_col = pick_col_prefer_non_per60(df, ["goalsAgainst", "GA", "goals_against", "GoalsAgainst"])
+    gf_total_col = pick_col_prefer_non_per60(df, GF_TOTAL_COL_CANDIDATES)
+    ga_total_col = pick_col_prefer_non_per60(df, GA_TOTAL_COL_CANDIDATES)
 
     rows_by_abbrev: Dict[str, Dict[str, Any]] = {}
-    team_xgf_list: List[float] = []
-
-    for _, r in df.iterrows():
-        team_val = r.get(team_col) if team_col else None
+    gp_by_abbrev: Dict[str, float] = {}
+
+    # Pull each picked column out as a plain list once; iterating zipped
+    # lists avoids materializing a Series per row the way iterrows does.
+    def col_values(col: Optional[str]) -> List[Any]:
+        return df[col].tolist() if col else [None] * len(df)
+
+    for team_val, gp_raw, xgf_pg_raw, xga_pg_raw, xgf_tot_raw, xga_tot_raw, gf_tot_raw, ga_tot_raw in zip(
+        col_values(team_col),
+        col_values(gp_col),
+        col_values(xgf_pg_col),
+        col_values(xga_pg_col),
+        col_values(xgf_total_col),
+        col_values(xga_total_col),
+        col_values(gf_total_col),
+        col_values(ga_total_col),
+    ):
         if team_val is None:
             continue
 
@@ -498,36 +697,31 @@ def build_slim_teams_and_lambda(teams_df: pd.DataFrame) -> Tuple[List[Dict[str,
         if not team_abbrev or team_abbrev not in ABBREV_SET:
             continue
 
-        gp = _safe_float(r.get(gp_col)) if gp_col else None
+        gp = _safe_float(gp_raw)
         if gp is None or gp <= 0:
             continue
 
-        xgf_pg: Optional[float] = None
-        xga_pg: Optional[float] = None
+        xgf_pg = _safe_float(xgf_pg_raw)
+        xga_pg = _safe_float(xga_pg_raw)
 
-        if xgf_pg_col:
-            xgf_pg = _safe_float(r.get(xgf_pg_col))
-        if xga_pg_col:
-            xga_pg = _safe_float(r.get(xga_pg_col))
-
-        if xgf_pg is None and xgf_total_col:
-            xgf_total = _safe_float(r.get(xgf_total_col))
+        if xgf_pg is None:
+            xgf_total = _safe_float(xgf_tot_raw)
             if xgf_total is not None:
                 xgf_pg = xgf_total / gp
 
-        if xga_pg is None and xga_total_col:
-            xga_total = _safe_float(r.get(xga_total_col))
+        if xga_pg is None:
+            xga_total = _safe_float(xga_tot_raw)
             if xga_total is not None:
                 xga_pg = xga_total / gp
 
         # Final fallback to GF/GA totals per game
-        if xgf_pg is None and gf_total_col:
-            gf_total = _safe_float(r.get(gf_total_col))
+        if xgf_pg is None:
+            gf_total = _safe_float(gf_tot_raw)
             if gf_total is not None:
                 xgf_pg = gf_total / gp
 
-        if xga_pg is None and ga_total_col:
-            ga_total = _safe_float(r.get(ga_total_col))
+        if xga_pg is None:
+            ga_total = _safe_float(ga_tot_raw)
             if ga_total is not None:
                 xga_pg = ga_total / gp
 
@@ -541,17 +735,22 @@ def build_slim_teams_and_lambda(teams_df: pd.DataFrame) -> Tuple[List[Dict[str,
         if not (1.0 <= xgf_pg <= 6.0 and 1.0 <= xga_pg <= 6.0):
             continue
 
-        if team_abbrev not in rows_by_abbrev:
+        # Keep the row with the most games played per team (first wins on
+        # ties), so a stray partial-season duplicate cannot shadow the
+        # full-season row.
+        if gp > gp_by_abbrev.get(team_abbrev, 0.0):
+            gp_by_abbrev[team_abbrev] = gp
             rows_by_abbrev[team_abbrev] = {
                 "team_abbrev": team_abbrev,
                 "xGF_pg": float(xgf_pg),
                 "xGA_pg": float(xga_pg),
             }
-            team_xgf_list.append(float(xgf_pg))
 
     # Combined goals per game baseline
-    if team_xgf_list:
-        league_avg_lambda = 2.0 * (sum(team_xgf_list) / len(team_xgf_list))
+    if rows_by_abbrev:
+        league_avg_lambda = 2.0 * (
+            sum(r["xGF_pg"] for r in rows_by_abbrev.values()) / len(rows_by_abbrev)
+        )
     else:
         league_avg_lambda = 6.0
 
@@ -568,13 +767,22 @@ def build_slim_teams_and_lambda(teams_df: pd.DataFrame) -> Tuple[List[Dict[str,
 def build_slim_goalies(goalies_df: pd.DataFrame) -> List[Dict[str, Any]]:
     df = norm_cols(goalies_df)
 
-    name_col = pick_col(df, ["goalie", "Goalie", "playerName", "name"])
-    gsae60_col = pick_col(df, ["goalsSavedAboveExpectedPer60", "GSAx/60", "gsaxPer60", "gsax_per60", "GSAx_per60"])
-    gsae_col = pick_col(df, ["goalsSavedAboveExpected", "GSAx", "gsae", "gsax"])
+    name_col = pick_col(df, GOALIE_NAME_COL_CANDIDATES)
+    gsae60_col = pick_col(df, GSAE60_COL_CANDIDATES)
+    gsae_col = pick_col(df, GSAE_COL_CANDIDATES)
+
+    if name_col is None or len(df) == 0:
+        return []
+
+    # Pull the three columns out once instead of materializing a Series per
+    # row via iterrows; the dedupe below stays a single dict pass.
+    names = df[name_col].tolist()
+    n = len(names)
+    gsae60s = df[gsae60_col].tolist() if gsae60_col else [None] * n
+    gsaes = df[gsae_col].tolist() if gsae_col else [None] * n
 
     rows: Dict[str, Dict[str, Any]] = {}
-    for _, r in df.iterrows():
-        name_val = r.get(name_col) if name_col else None
+    for name_val, gsae60_val, gsae_val in zip(names, gsae60s, gsaes):
         if name_val is None:
             continue
 
@@ -582,8 +790,8 @@ def build_slim_goalies(goalies_df: pd.DataFrame) -> List[Dict[str, Any]]:
         if not name:
             continue
 
-        gsae60 = _safe_float(r.get(gsae60_col)) if gsae60_col else None
-        gsae = _safe_float(r.get(gsae_col)) if gsae_col else None
+        gsae60 = _safe_float(gsae60_val)
+        gsae = _safe_float(gsae_val)
 
         if gsae60 is None and gsae is None:
             continue
@@ -597,20 +805,41 @@ def build_slim_goalies(goalies_df: pd.DataFrame) -> List[Dict[str, Any]]:
     return list(rows.values())
 
 
-def fetch_moneypuck_teams() -> Tuple[Optional[pd.DataFrame], Dict[str, Any]]:
+def fetch_moneypuck_csv(url: str, timeout: int = 30) -> Tuple[Optional[bytes], Dict[str, Any]]:
     try:
-        df = read_csv_url(MP_TEAMS_URL)
-        return df, {"ok": True}
+        raw, digest = cached_get_bytes(url, headers={"User-Agent": "nhl-daily-slim"}, timeout=timeout)
+        return raw, {"ok": True, "blake2b": digest}
     except Exception as e:
         return None, {"ok": False, "error": str(e)}
 
 
-def fetch_moneypuck_goalies() -> Tuple[Optional[pd.DataFrame], Dict[str, Any]]:
+# --------------------------- slim memo cache ----------------------------------
+
+def slim_memo_load(kind: str, digest: Optional[str], cache_dir: Path = _HTTP_CACHE_DIR) -> Optional[Any]:
+    """
+    Load memoized slim output for a CSV whose content hash is `digest`.
+    Returns None on any miss or error; callers fall back to parsing.
+    """
+    if not digest:
+        return None
+    path = cache_dir / f"{kind}_slim_{digest}.json"
+    if not path.exists():
+        return None
     try:
-        df = read_csv_url(MP_GOALIES_URL)
-        return df, {"ok": True}
-    except Exception as e:
-        return None, {"ok": False, "error": str(e)}
+        return json_loads_bytes(path.read_bytes())
+    except Exception:
+        return None
+
+
+def slim_memo_store(kind: str, digest: Optional[str], obj: Any, cache_dir: Path = _HTTP_CACHE_DIR) -> None:
+    if not digest:
+        return
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        path = cache_dir / f"{kind}_slim_{digest}.json"
+        path.write_bytes(json_dumps_bytes(obj, pretty=False))
+    except Exception:
+        pass
 
 
 # --------------------------- starters (DailyFaceoff) --------------------------
@@ -625,29 +854,122 @@ class _TextExtractor(HTMLParser):
             self.texts.append(data)
 
 
+def _extract_text_tokens(raw: bytes) -> List[str]:
+    """
+    Flatten the page to stripped text tokens. Prefers lxml's C parser
+    (roughly an order of magnitude faster than feeding HTMLParser on a
+    DailyFaceoff-sized page); falls back to the stdlib extractor when
+    lxml is unavailable.
+    """
+    if lxml_html is not None:
+        try:
+            tree = lxml_html.fromstring(raw)
+            for el in list(tree.iter("script", "style", "noscript")):
+                el.drop_tree()
+            return [t for t in (x.strip() for x in tree.itertext()) if t]
+        except Exception:
+            pass
+
+    parser = _TextExtractor()
+    parser.feed(_SCRIPT_STYLE_RE.sub("", raw.decode("utf-8", errors="ignore")))
+    return [t for t in (x.strip() for x in parser.texts) if t]
+
+
+# One C-level sweep to drop script/style/noscript payloads before the
+# stdlib HTMLParser fallback sees them (the lxml path drops the subtrees
+# directly instead).
+_SCRIPT_STYLE_RE = re.compile(r"<(script|style|noscript)\b[^>]*>.*?</\1\s*>", re.S | re.I)
+
 _STATUS_WORDS = {"confirmed", "expected", "probable", "projected", "likely", "unconfirmed", "unknown"}
 
 
 def _is_iso_datetime_token(s: str) -> bool:
-    return bool(re.match(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}", s))
+    return bool(_ISO_TOKEN_RE.match(s))
+
+
+_BAD_NAME_PREFIXES = ("w-l-otl", "gaa:", "sv%", "so:", "show more", "line combos", "news", "stats", "schedule", "source:")
 
 
 def _is_goalie_name_candidate(s: str) -> bool:
-    if not s:
-        return False
-    if len(s) < 5:
+    s = s.strip()
+    # Character-level gates first: length bounds and the space requirement
+    # kill most tokens (including ISO timestamps, which contain no space)
+    # before any lowercase copy or regex runs.
+    if len(s) < 5 or len(s) > 40 or " " not in s:
         return False
-    low = s.strip().lower()
+    low = s.lower()
     if low in _STATUS_WORDS:
         return False
-    if _is_iso_datetime_token(s.strip()):
+    if low.startswith(_BAD_NAME_PREFIXES):
         return False
-    bad_prefixes = ("w-l-otl", "gaa:", "sv%", "so:", "show more", "line combos", "news", "stats", "schedule", "source:")
-    if low.startswith(bad_prefixes):
-        return False
-    if " " not in s.strip():
-        return False
-    return bool(re.match(r"^[A-Za-z .'\-]+$", s.strip()))
+    return bool(_NAME_TOKEN_RE.match(s))
+
+
+def _next_data_rows(raw: bytes) -> Optional[List[Dict[str, Any]]]:
+    """
+    Locate the Next.js __NEXT_DATA__ script blob at the bytes level and
+    return props.pageProps.data rows, or None when the blob is absent or
+    malformed (callers fall back to text scanning).
+    """
+    anchor = raw.find(b'id="__NEXT_DATA__"')
+    if anchor < 0:
+        return None
+    start = raw.find(b">", anchor)
+    if start < 0:
+        return None
+    end = raw.find(b"</script>", start + 1)
+    if end < 0:
+        return None
+    try:
+        next_data = json_loads_bytes(raw[start + 1 : end])
+    except Exception:
+        return None
+    if not isinstance(next_data, dict):
+        return None
+    rows = next_data.get("props", {}).get("pageProps", {}).get("data", [])
+    if not isinstance(rows, list):
+        return None
+    return [r for r in rows if isinstance(r, dict)]
+
+
+def _rows_from_next_data(rows: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[str], int]:
+    """Map __NEXT_DATA__ game rows to the scraper's per-team row schema."""
+    out: List[Dict[str, Any]] = []
+    unmapped_teams: List[str] = []
+    games_found = 0
+
+    for r in rows:
+        away_team = str(r.get("awayTeamName") or r.get("awayTeam") or "").strip()
+        home_team = str(r.get("homeTeamName") or r.get("homeTeam") or "").strip()
+        if not away_team or not home_team:
+            continue
+        games_found += 1
+
+        away_abbrev = normalize_team_abbrev(away_team)
+        home_abbrev = normalize_team_abbrev(home_team)
+        if not away_abbrev:
+            unmapped_teams.append(away_team)
+        if not home_abbrev:
+            unmapped_teams.append(home_team)
+
+        for abbrev, team, goalie_key, status_key in (
+            (away_abbrev, away_team, "awayGoalieName", "awayNewsStrengthName"),
+            (home_abbrev, home_team, "homeGoalieName", "homeNewsStrengthName"),
+        ):
+            goalie = str(r.get(goalie_key) or "").strip()
+            if not abbrev or not goalie:
+                continue
+            out.append(
+                {
+                    "team": team,
+                    "team_abbrev": abbrev,
+                    "goalie_name": goalie,
+                    "status": normalize_status(r.get(status_key)),
+                    "commence_time": r.get("startTime") if isinstance(r.get("startTime"), str) else None,
+                }
+            )
+
+    return out, unmapped_teams, games_found
 
 
 def _scrape_dailyfaceoff_starting_goalies(date_et: str) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
@@ -657,86 +979,103 @@ def _scrape_dailyfaceoff_starting_goalies(date_et: str) -> Tuple[List[Dict[str,
     except Exception as e:
         return [], {"ok": False, "error": f"DailyFaceoff fetch failed: {str(e)}", "url": url}
 
-    parser = _TextExtractor()
+    # Structured route first: the page is Next.js, so the __NEXT_DATA__ blob
+    # carries the same rows the upstream fetcher reads, without an HTML parse.
+    json_rows = _next_data_rows(raw)
+    if json_rows is not None:
+        rows, unmapped_teams, games_found = _rows_from_next_data(json_rows)
+        if rows or games_found:
+            if games_found > 0 and not rows:
+                return [], {"ok": True, "note": "no starters posted yet", "url": url, "games_found": games_found}
+            return rows, {
+                "ok": True,
+                "url": url,
+                "games_found": games_found,
+                "unmapped_teams": sorted(set(unmapped_teams)),
+                "parse": "next_data",
+            }
+
     try:
-        parser.feed(raw.decode("utf-8", errors="ignore"))
+        tokens = _extract_text_tokens(raw)
     except Exception as e:
         return [], {"ok": False, "error": f"DailyFaceoff HTML parse failed: {str(e)}", "url": url}
-
-    tokens = [t.strip() for t in parser.texts if t and t.strip()]
     rows: List[Dict[str, Any]] = []
     unmapped_teams: List[str] = []
     games_found = 0
 
-    i = 0
-    while i < len(tokens):
-        t = tokens[i]
-        if " at " in t and len(t) < 120:
-            parts = t.split(" at ")
-            if len(parts) == 2:
-                away_team = parts[0].strip()
-                home_team = parts[1].strip()
-
-                j = i + 1
-                commence: Optional[str] = None
-                while j < len(tokens) and j < i + 20:
-                    if _is_iso_datetime_token(tokens[j]):
-                        commence = tokens[j]
+    # Index the matchup-header candidates up front so the outer walk only
+    # visits interesting tokens instead of testing every line for " at ".
+    header_idxs = [idx for idx, t in enumerate(tokens) if " at " in t and len(t) < 120]
+
+    pos = 0
+    for i in header_idxs:
+        if i < pos:
+            # Consumed by the previous game's goalie scan.
+            continue
+        parts = tokens[i].split(" at ")
+        if len(parts) != 2:
+            continue
+
+        away_team = parts[0].strip()
+        home_team = parts[1].strip()
+
+        j = i + 1
+        commence: Optional[str] = None
+        while j < len(tokens) and j < i + 20:
+            if _is_iso_datetime_token(tokens[j]):
+                commence = tokens[j]
+                break
+            j += 1
+
+        goalie_blocks: List[Tuple[str, str]] = []
+        k = (j + 1) if commence else (i + 1)
+        while k < len(tokens) and len(goalie_blocks) < 2:
+            cand = tokens[k]
+            if _is_goalie_name_candidate(cand):
+                name = cand.strip()
+                m = k + 1
+                status = "unknown"
+                while m < len(tokens) and m < k + 10:
+                    low = tokens[m].strip().lower()
+                    if low in _STATUS_WORDS:
+                        status = normalize_status(low)
                         break
-                    j += 1
-
-                goalie_blocks: List[Tuple[str, str]] = []
-                k = (j + 1) if commence else (i + 1)
-                while k < len(tokens) and len(goalie_blocks) < 2:
-                    cand = tokens[k]
-                    if _is_goalie_name_candidate(cand):
-                        name = cand.strip()
-                        m = k + 1
-                        status = "unknown"
-                        while m < len(tokens) and m < k + 10:
-                            low = tokens[m].strip().lower()
-                            if low in _STATUS_WORDS:
-                                status = normalize_status(low)
-                                break
-                            m += 1
-                        goalie_blocks.append((name, status))
-                        k = m + 1
-                        continue
-                    k += 1
-
-                away_abbrev = normalize_team_abbrev(away_team)
-                home_abbrev = normalize_team_abbrev(home_team)
-                if not away_abbrev:
-                    unmapped_teams.append(away_team)
-                if not home_abbrev:
-                    unmapped_teams.append(home_team)
-
-                if away_abbrev and len(goalie_blocks) >= 1:
-                    rows.append(
-                        {
-                            "team": away_team,
-                            "team_abbrev": away_abbrev,
-                            "goalie_name": goalie_blocks[0][0],
-                            "status": goalie_blocks[0][1],
-                            "commence_time": commence,
-                        }
-                    )
-                if home_abbrev and len(goalie_blocks) >= 2:
-                    rows.append(
-                        {
-                            "team": home_team,
-                            "team_abbrev": home_abbrev,
-                            "goalie_name": goalie_blocks[1][0],
-                            "status": goalie_blocks[1][1],
-                            "commence_time": commence,
-                        }
-                    )
-
-                games_found += 1
-                i = k
+                    m += 1
+                goalie_blocks.append((name, status))
+                k = m + 1
                 continue
-
-        i += 1
+            k += 1
+
+        away_abbrev = normalize_team_abbrev(away_team)
+        home_abbrev = normalize_team_abbrev(home_team)
+        if not away_abbrev:
+            unmapped_teams.append(away_team)
+        if not home_abbrev:
+            unmapped_teams.append(home_team)
+
+        if away_abbrev and len(goalie_blocks) >= 1:
+            rows.append(
+                {
+                    "team": away_team,
+                    "team_abbrev": away_abbrev,
+                    "goalie_name": goalie_blocks[0][0],
+                    "status": goalie_blocks[0][1],
+                    "commence_time": commence,
+                }
+            )
+        if home_abbrev and len(goalie_blocks) >= 2:
+            rows.append(
+                {
+                    "team": home_team,
+                    "team_abbrev": home_abbrev,
+                    "goalie_name": goalie_blocks[1][0],
+                    "status": goalie_blocks[1][1],
+                    "commence_time": commence,
+                }
+            )
+
+        games_found += 1
+        pos = k
 
     if games_found > 0 and not rows:
         return [], {"ok": True, "note": "no starters posted yet", "url": url, "games_found": games_found}
@@ -916,8 +1255,19 @@ def main() -> int:
     validations: Dict[str, Any] = {}
     slim: Dict[str, Any] = {}
 
-    # Odds
-    odds_payload, odds_status = fetch_odds_current()
+    # The four source fetches are independent of each other; run them
+    # concurrently so wall time is the slowest request, not the sum.
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        odds_future = ex.submit(fetch_odds_current)
+        teams_future = ex.submit(fetch_moneypuck_csv, MP_TEAMS_URL)
+        goalies_future = ex.submit(fetch_moneypuck_csv, MP_GOALIES_URL)
+        starters_future = ex.submit(fetch_starters, data_date)
+
+        odds_payload, odds_status = odds_future.result()
+        teams_raw, teams_status = teams_future.result()
+        goalies_raw, goalies_status = goalies_future.result()
+        starters_rows_raw, starters_status = starters_future.result()
+
     source_status["odds_current"] = odds_status
     odds_payload = odds_payload or []
 
@@ -955,15 +1305,26 @@ def main() -> int:
     validations["teams_count"] = len(slim["teams"])
 
     # Teams + league baseline (override baseline if parse works)
-    teams_df, teams_status = fetch_moneypuck_teams()
     source_status["teams"] = teams_status
 
     try:
-        if teams_df is not None and not teams_df.empty:
-            slim_teams, league_avg_lambda = build_slim_teams_and_lambda(teams_df)
-            slim["teams"] = slim_teams
-            slim["league_avg_lambda"] = float(league_avg_lambda)
-            validations["teams_count"] = len(slim_teams)
+        if teams_raw:
+            teams_memo = slim_memo_load("teams", teams_status.get("blake2b"))
+            if isinstance(teams_memo, dict) and isinstance(teams_memo.get("teams"), list):
+                slim["teams"] = teams_memo["teams"]
+                slim["league_avg_lambda"] = float(teams_memo["league_avg_lambda"])
+                validations["teams_count"] = len(teams_memo["teams"])
+            else:
+                teams_df = read_csv_subset(teams_raw, TEAMS_CSV_USECOLS)
+                slim_teams, league_avg_lambda = build_slim_teams_and_lambda(teams_df)
+                slim["teams"] = slim_teams
+                slim["league_avg_lambda"] = float(league_avg_lambda)
+                validations["teams_count"] = len(slim_teams)
+                slim_memo_store(
+                    "teams",
+                    teams_status.get("blake2b"),
+                    {"teams": slim_teams, "league_avg_lambda": float(league_avg_lambda)},
+                )
         else:
             source_status["teams"] = dict(source_status["teams"] or {})
             source_status["teams"]["ok"] = False
@@ -977,18 +1338,23 @@ def main() -> int:
     validations["league_avg_lambda"] = float(slim.get("league_avg_lambda") or 0.0)
 
     # Goalies (optional)
-    goalies_df, goalies_status = fetch_moneypuck_goalies()
     source_status["goalies"] = goalies_status
-    if goalies_df is not None and not goalies_df.empty:
-        slim_goalies = build_slim_goalies(goalies_df)
-        slim["goalies"] = slim_goalies
-        validations["goalies_count"] = len(slim_goalies)
+    if goalies_raw:
+        goalies_memo = slim_memo_load("goalies", goalies_status.get("blake2b"))
+        if isinstance(goalies_memo, list):
+            slim["goalies"] = goalies_memo
+            validations["goalies_count"] = len(goalies_memo)
+        else:
+            goalies_df = read_csv_subset(goalies_raw, GOALIES_CSV_USECOLS)
+            slim_goalies = build_slim_goalies(goalies_df)
+            slim["goalies"] = slim_goalies
+            validations["goalies_count"] = len(slim_goalies)
+            slim_memo_store("goalies", goalies_status.get("blake2b"), slim_goalies)
     else:
         slim["goalies"] = []
         validations["goalies_count"] = 0
 
-    # Starters (for today's ET slate)
-    starters_rows_raw, starters_status = fetch_starters(date_et=data_date)
+    # Starters (for today's ET slate; fetched above)
     starters_rows, unmapped_teams = build_starters_for_slate(slimmed_odds, starters_rows_raw or [])
     slim["starters"] = starters_rows
     validations["starters_count"] = len(starters_rows)
@@ -1065,17 +1431,15 @@ def main() -> int:
     out_dir = Path("data")
     out_dir.mkdir(parents=True, exist_ok=True)
 
+    # Serialize each flavor once and write from the buffer.
+    pretty_payload = json_dumps_bytes(out_obj) + b"\n"
+    compact_payload = json_dumps_bytes(out_obj, pretty=False) + b"\n"
+
     # Pretty (primary) output
-    out_path_pretty = out_dir / "nhl_daily_slim.json"
-    with out_path_pretty.open("w", encoding="utf-8", newline="\n") as f:
-        json.dump(out_obj, f, ensure_ascii=False, indent=2, sort_keys=True, allow_nan=False)
-        f.write("\n")
-
-    # Optional smaller consumer file (still pretty, but same content here)
-    out_path_min = out_dir / "nhl_daily_min.json"
-    with out_path_min.open("w", encoding="utf-8", newline="\n") as f:
-        json.dump(out_obj, f, ensure_ascii=False, indent=2, sort_keys=True, allow_nan=False)
-        f.write("\n")
+    atomic_write_bytes(out_dir / "nhl_daily_slim.json", pretty_payload)
+
+    # Smaller consumer file: same content, compact encoding
+    atomic_write_bytes(out_dir / "nhl_daily_min.json", compact_payload)
 
     return 0
 
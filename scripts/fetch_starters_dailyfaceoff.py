@@ -15,27 +15,65 @@ import datetime as dt
 import hashlib
 import json
 import os
-import re
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from operator import attrgetter
 from typing import Any, Dict, List, Optional, Tuple
-from urllib.request import Request, urlopen
+import requests
+from requests.adapters import HTTPAdapter, Retry
+
+try:
+    import orjson
+except Exception:
+    orjson = None  # type: ignore
 
 from scripts.team_map import team_abbr_from_any_label
 
+# Labels repeat across rows and dates; cache successful lookups. A KeyError
+# for an unknown label propagates uncached, preserving the contract callers
+# rely on for fallback behavior.
+_team_abbr_cached = lru_cache(maxsize=256)(team_abbr_from_any_label)
+
 BASE = "https://www.dailyfaceoff.com"
 
+# Pooled session: keep-alive across calls (date backfills hit the same host
+# repeatedly) and automatic gzip decode, with retries on transient upstream
+# errors.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=4,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504)),
+    ),
+)
+
 
 # --------------------------- helpers -----------------------------------------
 
-def sha256_bytes(b: bytes) -> str:
-    return hashlib.sha256(b).hexdigest()
+def page_hash(b: bytes) -> str:
+    # Debug identity only, never verified — blake2b is markedly faster than
+    # sha256 on a full page and 16 bytes is plenty to tell fetches apart.
+    return hashlib.blake2b(b, digest_size=16).hexdigest()
 
 
 def utc_now_iso() -> str:
     return dt.datetime.now(dt.timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
 
 
-def http_get_html(url: str, timeout: int = 30) -> Tuple[str, bytes, Dict[str, str]]:
+_CACHE_DIR = "data/.cache"
+
+
+def _etag_cache_paths(url: str) -> Tuple[str, str]:
+    key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    return (
+        os.path.join(_CACHE_DIR, f"dfo_{key}.etag"),
+        os.path.join(_CACHE_DIR, f"dfo_{key}.body"),
+    )
+
+
+def http_get_html(url: str, timeout: int = 30) -> Tuple[bytes, Dict[str, str]]:
     headers = {
         "User-Agent": (
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -44,27 +82,56 @@ def http_get_html(url: str, timeout: int = 30) -> Tuple[str, bytes, Dict[str, st
         ),
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
         "Accept-Language": "en-US,en;q=0.9",
-        "Cache-Control": "no-cache",
-        "Pragma": "no-cache",
         "Referer": BASE + "/",
     }
 
-    req = Request(url, headers=headers)
-    with urlopen(req, timeout=timeout) as resp:
-        raw = resp.read()
-        resp_headers: Dict[str, str] = {}
-        for k in ["content-type", "cache-control", "server", "cf-ray", "x-cache"]:
-            v = resp.headers.get(k)
-            if v:
-                resp_headers[k] = v
+    # Conditional GET: retry loops and backfills for the same date usually
+    # see identical HTML, so a 304 skips the download and the parse input
+    # comes back from the on-disk body cache.
+    etag_path, body_path = _etag_cache_paths(url)
+    etag: Optional[str] = None
+    if os.path.exists(etag_path) and os.path.exists(body_path):
+        try:
+            with open(etag_path, "r", encoding="utf-8") as f:
+                etag = f.read().strip() or None
+        except Exception:
+            etag = None
+    if etag:
+        headers["If-None-Match"] = etag
+
+    resp = _SESSION.get(url, headers=headers, timeout=timeout)
+    if resp.status_code == 304 and etag:
+        with open(body_path, "rb") as f:
+            raw = f.read()
+        return raw, {"x-cache": "etag-304"}
+    resp.raise_for_status()
+
+    raw = resp.content
+    resp_headers: Dict[str, str] = {}
+    for k in ["content-type", "cache-control", "server", "cf-ray", "x-cache"]:
+        v = resp.headers.get(k)
+        if v:
+            resp_headers[k] = v
+    new_etag = resp.headers.get("ETag")
+
+    if new_etag:
+        try:
+            ensure_parent_dir(body_path)
+            with open(body_path, "wb") as f:
+                f.write(raw)
+            with open(etag_path, "w", encoding="utf-8") as f:
+                f.write(new_etag + "\n")
+        except Exception:
+            pass
 
-    html = raw.decode("utf-8", errors="replace")
-    return html, raw, resp_headers
+    return raw, resp_headers
 
 
 def ensure_parent_dir(path: str) -> None:
     parent = os.path.dirname(path)
-    if parent and not os.path.exists(parent):
+    if parent:
+        # makedirs with exist_ok already no-ops on an existing dir; a prior
+        # exists() check is an extra stat and a race under concurrent runs.
         os.makedirs(parent, exist_ok=True)
 
 
@@ -77,41 +144,73 @@ def write_debug_html(date_et: str, html: str) -> str:
 
 
 def normalize_status(raw: str) -> str:
-    s = (raw or "").strip().lower()
-    # DailyFaceoff uses strings like "Confirmed", "Expected", etc.
-    if "confirm" in s:
-        return "confirmed"
-    return "projected"
-
-
-def extract_next_data_json(html: str) -> Optional[Dict[str, Any]]:
-    m = re.search(r'<script[^>]+id="__NEXT_DATA__"[^>]*>(.*?)</script>', html, re.S)
-    if not m:
+    # DailyFaceoff uses strings like "Confirmed", "Expected", etc. The
+    # substring test is whitespace-tolerant, so no strip is needed and only
+    # one lowercase copy is made.
+    return "confirmed" if raw and "confirm" in raw.lower() else "projected"
+
+
+def extract_next_data_json(raw: bytes) -> Optional[Dict[str, Any]]:
+    # Plain substring scans instead of a lazy-dot regex over the whole page:
+    # three C-level find calls, no backtracking. Working on the raw bytes
+    # means the full page never gets decoded to str just to slice out the
+    # blob — both JSON parsers accept UTF-8 bytes directly.
+    anchor = raw.find(b'id="__NEXT_DATA__"')
+    if anchor < 0:
+        return None
+    start = raw.find(b">", anchor)
+    if start < 0:
+        return None
+    end = raw.find(b"</script>", start + 1)
+    if end < 0:
         return None
-    blob = m.group(1).strip()
+    blob = raw[start + 1 : end].strip()
     try:
+        if orjson is not None:
+            return orjson.loads(blob)
         return json.loads(blob)
     except Exception:
         return None
 
 
+_TS_KEYS = ("homeNewsCreatedAt", "awayNewsCreatedAt", "newsCreatedAt", "updatedAt", "lastUpdatedAt")
+
+
 def best_last_updated_utc_from_game_rows(rows: List[Dict[str, Any]]) -> Optional[str]:
     # Rows often include timestamps like:
     # homeNewsCreatedAt: '2026-01-08T23:34:39.410Z'
     # awayNewsCreatedAt: '2026-01-08T23:34:39.410Z'
-    stamps: List[str] = []
-    for r in rows:
-        for k in ["homeNewsCreatedAt", "awayNewsCreatedAt", "newsCreatedAt", "updatedAt", "lastUpdatedAt"]:
-            v = r.get(k)
-            if isinstance(v, str) and "T" in v and v.endswith("Z"):
-                stamps.append(v)
-    if not stamps:
-        return None
-    return max(stamps)
+    # ISO-8601 Z strings sort lexicographically, so max over the raw strings
+    # is the newest stamp — no datetime parsing and no intermediate list.
+    return max(
+        (
+            v
+            for r in rows
+            for k in _TS_KEYS
+            if isinstance(v := r.get(k), str) and "T" in v and v.endswith("Z")
+        ),
+        default=None,
+    )
 
 
 # --------------------------- main fetch --------------------------------------
 
+@dataclass(slots=True)
+class StarterSide:
+    team: str
+    goalie: Optional[str]
+    status: str
+
+
+@dataclass(slots=True)
+class StarterRecord:
+    game_key: str
+    date_et: str
+    away: StarterSide
+    home: StarterSide
+    source: Dict[str, Any]
+
+
 @dataclass
 class StartersFetchResult:
     starters: List[Dict[str, Any]]
@@ -121,13 +220,13 @@ class StartersFetchResult:
 def fetch_dailyfaceoff_starters(date_et: str) -> StartersFetchResult:
     url = f"{BASE}/starting-goalies/{date_et}"
 
-    html, raw, resp_headers = http_get_html(url)
-    html_sha = sha256_bytes(raw)
+    raw, resp_headers = http_get_html(url)
+    html_hash = page_hash(raw)
 
-    starters: List[Dict[str, Any]] = []
+    records_by_key: Dict[str, StarterRecord] = {}
     debug_path: Optional[str] = None
 
-    next_data = extract_next_data_json(html)
+    next_data = extract_next_data_json(raw)
     rows: List[Dict[str, Any]] = []
 
     if next_data:
@@ -156,35 +255,32 @@ def fetch_dailyfaceoff_starters(date_et: str) -> StartersFetchResult:
         if not away_goalie_name and not home_goalie_name:
             continue
 
-        away_team = team_abbr_from_any_label(str(away_team_label))
-        home_team = team_abbr_from_any_label(str(home_team_label))
+        away_team = _team_abbr_cached(str(away_team_label))
+        home_team = _team_abbr_cached(str(home_team_label))
         if not away_team or not home_team:
             continue
 
         game_key = f"{away_team}_vs_{home_team}_{date_et}"
 
-        starters.append(
-            {
-                "game_key": game_key,
-                "date_et": date_et,
-                "away": {"team": away_team, "goalie": away_goalie_name, "status": away_status},
-                "home": {"team": home_team, "goalie": home_goalie_name, "status": home_status},
-                "source": {"site": "dailyfaceoff", "url": url, "last_updated_utc": last_updated_utc},
-            }
+        # Keyed insert dedupes as we go (last record per game_key wins).
+        records_by_key[game_key] = StarterRecord(
+            game_key=game_key,
+            date_et=date_et,
+            away=StarterSide(team=away_team, goalie=away_goalie_name, status=away_status),
+            home=StarterSide(team=home_team, goalie=home_goalie_name, status=home_status),
+            source={"site": "dailyfaceoff", "url": url, "last_updated_utc": last_updated_utc},
         )
 
-    # Dedup and sort
-    dedup: Dict[str, Dict[str, Any]] = {}
-    for s in starters:
-        dedup[s["game_key"]] = s
-    starters = list(dedup.values())
-    starters.sort(key=lambda x: x["game_key"])
+    # Sort, then flatten the slotted records into dicts at the output boundary.
+    starters = [asdict(r) for r in sorted(records_by_key.values(), key=attrgetter("game_key"))]
 
     ok = True
     reason = None
 
     if len(starters) == 0:
-        debug_path = write_debug_html(date_et, html)
+        # Decode only on this failure path; the success path never needs
+        # the page as str.
+        debug_path = write_debug_html(date_et, raw.decode("utf-8", errors="replace"))
         ok = False
         reason = "Parsed 0 starters (blocked/selector drift). Debug HTML saved."
 
@@ -192,7 +288,7 @@ def fetch_dailyfaceoff_starters(date_et: str) -> StartersFetchResult:
         "ok": ok,
         "url": url,
         "count": len(starters),
-        "html_sha256": html_sha,
+        "html_blake2b": html_hash,
         "resp_headers": resp_headers,
     }
     if reason:
@@ -5,6 +5,7 @@ import json
 import math
 import datetime as dt
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -13,6 +14,13 @@ try:
 except Exception:
     ZoneInfo = None  # type: ignore
 
+try:
+    import orjson
+except Exception:
+    orjson = None  # type: ignore
+
+
+_ET = ZoneInfo("America/New_York") if ZoneInfo is not None else dt.timezone(dt.timedelta(hours=-5))
 
 DATA_PATH = Path("data/nhl_daily_slim.json")
 OUT_MD = Path("data/nhl_signals.md")
@@ -23,9 +31,12 @@ ML_PRICE_MIN = -250
 ML_PRICE_MAX = 250
 
 
+_INV_SQRT2 = 1.0 / math.sqrt(2.0)
+
+
 def normal_cdf(x: float) -> float:
     # Standard normal CDF via erf
-    return 0.5 * (1.0 + math.erf(x / math.sqrt(2.0)))
+    return 0.5 * (1.0 + math.erf(x * _INV_SQRT2))
 
 
 def poisson_cdf(k: int, mu: float) -> float:
@@ -42,7 +53,9 @@ def poisson_cdf(k: int, mu: float) -> float:
     return min(1.0, max(0.0, s))
 
 
+@lru_cache(maxsize=1024)
 def implied_prob_from_american(odds: int) -> Optional[float]:
+    # American prices cluster in a small integer set, so memoize.
     if odds == 0:
         return None
     if odds < 0:
@@ -76,11 +89,7 @@ def to_et_time_str(iso_utc: str) -> str:
         t = dt.datetime.fromisoformat(s)
         if t.tzinfo is None:
             t = t.replace(tzinfo=dt.timezone.utc)
-        if ZoneInfo is not None:
-            et = t.astimezone(ZoneInfo("America/New_York"))
-        else:
-            et = t.astimezone(dt.timezone(dt.timedelta(hours=-5)))
-        return et.strftime("%-I:%M %p ET")
+        return t.astimezone(_ET).strftime("%-I:%M %p ET")
     except Exception:
         return str(iso_utc)
 
@@ -98,7 +107,8 @@ class TotSig:
 
 
 def main() -> int:
-    obj = json.loads(DATA_PATH.read_text(encoding="utf-8"))
+    raw = DATA_PATH.read_bytes()
+    obj = orjson.loads(raw) if orjson is not None else json.loads(raw)
     slim = obj["slim"]
 
     odds_games: List[Dict[str, Any]] = slim.get("odds_current") or []
@@ -167,6 +177,9 @@ def main() -> int:
         p_home = min(1.0, max(0.0, p_home))
         p_away = 1.0 - p_home
 
+        # One ET conversion per game; both sides and both totals reuse it.
+        time_et = to_et_time_str(commence) if isinstance(commence, str) else str(commence)
+
         # Moneyline prices
         h2h = g.get("h2h") or {}
         best = (h2h.get("best") or {}) if isinstance(h2h, dict) else {}
@@ -189,20 +202,30 @@ def main() -> int:
             if edge_pp < EDGE_MIN_PP:
                 return
             fair = fair_american_from_prob(model_p)
-            time_et = to_et_time_str(commence) if isinstance(commence, str) else str(commence)
-            line = (
-                f"{time_et} {away_ab} @ {home_ab} | {side} ML {price} ({book})"
-                f" | model {model_p*100:.1f}% | implied {imp*100:.1f}% | edge +{edge_pp:.1f}pp"
-                f" | fair {fair if fair is not None else 'n/a'} | rest_adv_home {rest_map.get(gid,0)} (rest not applied to ML)"
+            line = " | ".join(
+                (
+                    f"{time_et} {away_ab} @ {home_ab}",
+                    f"{side} ML {price} ({book})",
+                    f"model {model_p*100:.1f}%",
+                    f"implied {imp*100:.1f}%",
+                    f"edge +{edge_pp:.1f}pp",
+                    f"fair {fair if fair is not None else 'n/a'}",
+                    f"rest_adv_home {rest_map.get(gid, 0)} (rest not applied to ML)",
+                )
             )
             ml_signals.append(MLSig(edge_pp=edge_pp, line=line))
 
         maybe_add_ml(home_ab, home_price, home_book, p_home)
         maybe_add_ml(away_ab, away_price, away_book, p_away)
 
-        # Totals (rest-adjusted)
-        rest_adv = rest_map.get(gid, 0)
-        rest_missing = "rest missing" if gid not in rest_map else "rest applied"
+        # Totals (rest-adjusted); one lookup decides both the value and the label
+        rest_adv_opt = rest_map.get(gid)
+        if rest_adv_opt is None:
+            rest_adv = 0
+            rest_missing = "rest missing"
+        else:
+            rest_adv = rest_adv_opt
+            rest_missing = "rest applied"
 
         mu_home_tot = max(0.1, mu_home_base + REST_GOALS_PER_DAY * rest_adv)
         mu_away_tot = max(0.1, mu_away_base - REST_GOALS_PER_DAY * rest_adv)
@@ -241,12 +264,18 @@ def main() -> int:
             if edge_pp < EDGE_MIN_PP:
                 return
             fair = fair_american_from_prob(model_p)
-            time_et = to_et_time_str(commence) if isinstance(commence, str) else str(commence)
-            line = (
-                f"{time_et} {away_ab} @ {home_ab} | {pick} {Lf} {price} ({book})"
-                f" | model {model_p*100:.1f}% | implied {imp*100:.1f}% | edge +{edge_pp:.1f}pp"
-                f" | fair {fair if fair is not None else 'n/a'}"
-                f" | mu_total {mu_total:.2f} | line {line_type} | rest_adv_home {rest_adv} ({rest_missing})"
+            line = " | ".join(
+                (
+                    f"{time_et} {away_ab} @ {home_ab}",
+                    f"{pick} {Lf} {price} ({book})",
+                    f"model {model_p*100:.1f}%",
+                    f"implied {imp*100:.1f}%",
+                    f"edge +{edge_pp:.1f}pp",
+                    f"fair {fair if fair is not None else 'n/a'}",
+                    f"mu_total {mu_total:.2f}",
+                    f"line {line_type}",
+                    f"rest_adv_home {rest_adv} ({rest_missing})",
+                )
             )
             tot_signals.append(TotSig(edge_pp=edge_pp, line=line))
 
@@ -1,7 +1,9 @@
 # scripts/team_map.py
 from __future__ import annotations
 
-TEAM_TO_ABBR: dict[str, str] = {
+from types import MappingProxyType
+
+TEAM_TO_ABBR: MappingProxyType[str, str] = MappingProxyType({
     "Anaheim Ducks": "ANA",
     "Boston Bruins": "BOS",
     "Buffalo Sabres": "BUF",
@@ -34,16 +36,27 @@ TEAM_TO_ABBR: dict[str, str] = {
     "Vegas Golden Knights": "VGK",
     "Washington Capitals": "WSH",
     "Winnipeg Jets": "WPG",
-}
+})
 
-TEAM_NAME_ALIASES: dict[str, str] = {
+TEAM_NAME_ALIASES: MappingProxyType[str, str] = MappingProxyType({
     "St Louis Blues": "St. Louis Blues",
     "LA Kings": "Los Angeles Kings",
     "Utah": "Utah Hockey Club",
     "Utah HC": "Utah Hockey Club",
+    "Utah Mammoth": "Utah Hockey Club",
     # legacy franchise label that might still appear in some sources
     "Arizona Coyotes": "Utah Hockey Club",
-}
+})
+
+# Canonical names and aliases merged once at import, so a label resolves
+# with a single hash lookup instead of normalize-then-map.
+_ALL_LABELS: dict[str, str] = dict(TEAM_TO_ABBR)
+for _alias, _canonical in TEAM_NAME_ALIASES.items():
+    _ALL_LABELS[_alias] = TEAM_TO_ABBR[_canonical]
+
+# Casefolded shadow table so "BOSTON BRUINS" / "boston bruins" resolve
+# without per-call casing heuristics at the call sites.
+_LOWER_LABELS: dict[str, str] = {_label.casefold(): _abbr for _label, _abbr in _ALL_LABELS.items()}
 
 def normalize_team_name(name: str) -> str:
     n = (name or "").strip()
@@ -52,5 +65,8 @@ def normalize_team_name(name: str) -> str:
     return TEAM_NAME_ALIASES.get(n, n)
 
 def team_abbr_from_any_label(label: str) -> str:
-    canonical = normalize_team_name(label)
-    return TEAM_TO_ABBR[canonical]
+    key = (label or "").strip()
+    abbr = _ALL_LABELS.get(key)
+    if abbr is not None:
+        return abbr
+    return _LOWER_LABELS[key.casefold()]